@@ -17,7 +17,6 @@ namespace PathMoverTest
             PathMoverStatics = new PathMoverStatics();
 
             //准备路由表
-            Dictionary<(ControlPoint, ControlPoint), ControlPoint> routeTable = new Dictionary<(ControlPoint, ControlPoint), ControlPoint>();
             ControlPoint A = new ControlPoint("A");
             ControlPoint B = new ControlPoint("B");
             ControlPoint C = new ControlPoint("C");
@@ -46,6 +46,7 @@ namespace PathMover
                 if (!targetCp.Tag.Equals(cp.Tag))
                 {
                     sameInSameOut = false;
+                    break;
                 }
             }
             if (sameInSameOut)
@@ -54,11 +55,12 @@ namespace PathMover
                 return;
             }
 
-            if (!_pendingListByCP.ContainsKey(cp))
+            if (!_pendingListByCP.TryGetValue(cp, out List<Vehicle> pendingList))
             {
-                _pendingListByCP.Add(cp, new List<Vehicle>());
+                pendingList = new List<Vehicle>();
+                _pendingListByCP.Add(cp, pendingList);
             }
-            _pendingListByCP[cp].Add(vehicle);
+            pendingList.Add(vehicle);
             Schedule(() => AttemptToEnter(cp), TimeSpan.FromMilliseconds(1));
         }
 
@@ -68,8 +70,8 @@ namespace PathMover
         #region Internal Events
         void AttemptToEnter(ControlPoint cp)
         {
-            if (!_pendingListByCP.ContainsKey(cp) || _pendingListByCP[cp].Count == 0) return;
-            foreach (Vehicle vehicle in _pendingListByCP[cp])
+            if (!_pendingListByCP.TryGetValue(cp, out List<Vehicle> pendingList) || pendingList.Count == 0) return;
+            foreach (Vehicle vehicle in pendingList)
             {
                 ControlPoint controlPoint = cp;
                 PmPath nextPath = vehicle.NextPath(controlPoint.Tag);
@@ -111,10 +113,12 @@ namespace PathMover
             vehicle.CurrentPath = path;
             vehicle.RemoveTarget(vehicle.CurrentPath.StartPoint.Tag);
             path.RemainingCapacity -= vehicle.CapacityNeeded;
-            HC_PathMap[(path.StartPoint.Tag, path.EndPoint.Tag)].ObserveChange(vehicle.CapacityNeeded);
-            if (HC_PathMap[(path.StartPoint.Tag, path.EndPoint.Tag)].LastCount > MaxAgvInPathMap[(path.StartPoint.Tag, path.EndPoint.Tag)])
+            (string, string) pathKey = (path.StartPoint.Tag, path.EndPoint.Tag);
+            HourCounter hcPath = HC_PathMap[pathKey];
+            hcPath.ObserveChange(vehicle.CapacityNeeded);
+            if (hcPath.LastCount > MaxAgvInPathMap[pathKey])
             {
-                MaxAgvInPathMap[(path.StartPoint.Tag, path.EndPoint.Tag)] = HC_PathMap[(path.StartPoint.Tag, path.EndPoint.Tag)].LastCount;
+                MaxAgvInPathMap[pathKey] = hcPath.LastCount;
             }
             double timeDelay = path.Length / vehicle.Speed;
             if (vehicle.IsStoped == true)
@@ -32,6 +32,7 @@ namespace PathMover
         private Dictionary<(string, string), PmPath> _routeTable = new Dictionary<(string, string), PmPath>();
         private Dictionary<string, ControlPoint> _routePoints = new Dictionary<string, ControlPoint>();
         public List<(string, string)> PathList = new List<(string, string)>();
+        private HashSet<(string, string)> _pathSet = new HashSet<(string, string)>();
         //private readonly StreamWriter _swPathMoverStatics;
         #endregion
 
@@ -49,28 +50,16 @@ namespace PathMover
         public void AddPath(string from, string to, PmPath nextHop)
         {
             // update route table
-            if (!_routeTable.ContainsKey((from, to)))
-            {
-                _routeTable.Add((from, to), nextHop);
-            }
+            _routeTable.TryAdd((from, to), nextHop);
             // update control point list
-            if (!_routePoints.ContainsKey(from))
-            {
-                _routePoints.Add(from, nextHop.StartPoint);
-            }
-            if (!_routePoints.ContainsKey(to))
-            {
-                _routePoints.Add(to, nextHop.EndPoint);
-            }
+            _routePoints.TryAdd(from, nextHop.StartPoint);
+            _routePoints.TryAdd(to, nextHop.EndPoint);
             //update path list
-            if (!PathList.Contains((nextHop.StartPoint.Tag, nextHop.EndPoint.Tag)))
+            if (_pathSet.Add((nextHop.StartPoint.Tag, nextHop.EndPoint.Tag)))
             {
                 PathList.Add((nextHop.StartPoint.Tag, nextHop.EndPoint.Tag));
                 // Since we need HC_PathMap to record every path, need to add every path into _routeTable
-                if (!_routeTable.ContainsKey((nextHop.StartPoint.Tag, nextHop.EndPoint.Tag)))
-                {
-                    _routeTable.Add((nextHop.StartPoint.Tag, nextHop.EndPoint.Tag), nextHop);
-                }
+                _routeTable.TryAdd((nextHop.StartPoint.Tag, nextHop.EndPoint.Tag), nextHop);
             }
         }
 
@@ -81,9 +70,9 @@ namespace PathMover
 
         public ControlPoint GetControlPoint(string tag)
         {
-            if (_routePoints.ContainsKey(tag))
-            { 
-                return _routePoints[tag];
+            if (_routePoints.TryGetValue(tag, out ControlPoint controlPoint))
+            {
+                return controlPoint;
             }
             else
             {